@@ -1,3 +1,4 @@
+from collections import deque
 import logging
 import requests
 
@@ -6,11 +7,23 @@ from meal_max.utils.logger import configure_logger
 logger = logging.getLogger(__name__)
 configure_logger(logger)
 
+# Numbers fetched per request; the extras are served from _buffer
+_BATCH = 64
+_URL = f"https://www.random.org/decimal-fractions/?num={_BATCH}&dec=2&col=1&format=plain&rnd=new"
+
+# Reused across calls so the TCP/TLS connection to random.org is kept alive
+_SESSION = requests.Session()
+
+_buffer = deque()
+
 
 def get_random() -> float:
     """
     Fetches a random decimal fraction between 0 and 1 from random.org.
 
+    Numbers are requested in batches of _BATCH; later calls are served from
+    the buffered batch until it runs out.
+
     Returns:
         float: The random decimal number fetched from random.org.
 
@@ -18,23 +31,34 @@ def get_random() -> float:
         RuntimeError: If the request to random.org fails, times out, or returns an invalid response.
         ValueError: If the response from random.org cannot be converted to a valid float.
     """
-    url = "https://www.random.org/decimal-fractions/?num=1&dec=2&col=1&format=plain&rnd=new"
+    try:
+        random_number = _buffer.popleft()
+        logger.info("Using buffered random number: %.3f", random_number)
+        return random_number
+    except IndexError:
+        pass
 
     try:
         # Log the request to random.org
-        logger.info("Fetching random number from %s", url)
+        logger.info("Fetching random numbers from %s", _URL)
 
-        response = requests.get(url, timeout=5)
+        response = _SESSION.get(_URL, timeout=5)
 
         # Check if the request was successful
         response.raise_for_status()
 
-        random_number_str = response.text.strip()
+        random_numbers = []
+        for random_number_str in response.text.split():
+            try:
+                random_numbers.append(float(random_number_str))
+            except ValueError:
+                raise ValueError("Invalid response from random.org: %s" % random_number_str)
+
+        if not random_numbers:
+            raise ValueError("Invalid response from random.org: %s" % response.text)
 
-        try:
-            random_number = float(random_number_str)
-        except ValueError:
-            raise ValueError("Invalid response from random.org: %s" % random_number_str)
+        random_number = random_numbers[0]
+        _buffer.extend(random_numbers[1:])
 
         logger.info("Received random number: %.3f", random_number)
         return random_number
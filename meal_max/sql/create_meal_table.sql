@@ -8,4 +8,7 @@ CREATE TABLE meals (
     battles INTEGER DEFAULT 0,
     wins INTEGER DEFAULT 0,
     deleted BOOLEAN DEFAULT FALSE
-);
\ No newline at end of file
+);
+
+-- Lets the default leaderboard (ORDER BY wins DESC) read meals in index order instead of sorting
+CREATE INDEX ix_meals_wins ON meals (deleted, wins DESC);
\ No newline at end of file
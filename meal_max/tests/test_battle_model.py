@@ -0,0 +1,128 @@
+from unittest.mock import call
+
+import pytest
+
+from meal_max.models.battle_model import BattleModel
+from meal_max.models.kitchen_model import Meal
+
+
+@pytest.fixture(scope="module")
+def _battle_model_singleton():
+    return BattleModel()
+
+@pytest.fixture()
+def battle_model(_battle_model_singleton):
+    """Fixture to provide an empty BattleModel for each test.
+
+    BattleModel keeps no state besides its combatants list, so one instance
+    is shared by the module and cleared before and after every test.
+    """
+    _battle_model_singleton.clear_combatants()
+    yield _battle_model_singleton
+    _battle_model_singleton.clear_combatants()
+
+"""Fixtures providing sample meals for the tests.
+
+Meals are only read or handed to prep_combatant, never mutated, so they
+are built once per module."""
+@pytest.fixture(scope="module")
+def sample_meal1():
+    return Meal(1, 'Pasta', 'Italian', 10.0, 'MED')
+
+@pytest.fixture(scope="module")
+def sample_meal2():
+    return Meal(2, 'Sushi', 'Japanese', 12.0, 'LOW')
+
+@pytest.fixture(scope="module")
+def sample_meal3():
+    return Meal(3, 'Burger', 'American', 8.0, 'HIGH')
+
+@pytest.fixture
+def battle_model_two(battle_model, sample_meal1, sample_meal2):
+    """BattleModel with sample_meal1 and sample_meal2 already prepped.
+
+    The combatants are added directly, bypassing prep_combatant; the
+    prep_combatant tests below cover that path.
+    """
+    battle_model.combatants.extend([sample_meal1, sample_meal2])
+    return battle_model
+
+
+##################################################
+# Combatant Management Test Cases
+##################################################
+
+def test_prep_combatant_success(battle_model, sample_meal1):
+    """Test adding a combatant to the combatants list."""
+    battle_model.prep_combatant(sample_meal1)
+    assert len(battle_model.combatants) == 1
+    assert battle_model.combatants[0].meal == 'Pasta'
+
+def test_prep_combatant_full_list(battle_model, sample_meal1, sample_meal2, sample_meal3):
+    """Test error when adding a third combatant."""
+    battle_model.prep_combatant(sample_meal1)
+    battle_model.prep_combatant(sample_meal2)
+
+    with pytest.raises(ValueError, match="Combatant list is full, cannot add more combatants."):
+        battle_model.prep_combatant(sample_meal3)
+
+def test_clear_combatants(battle_model_two):
+    """Test clearing the combatants list."""
+    battle_model_two.clear_combatants()
+    assert len(battle_model_two.combatants) == 0, "Combatants should be empty after clearing"
+
+def test_get_combatants_with_entries(battle_model_two, sample_meal1, sample_meal2):
+    """Test retrieving the current combatants."""
+    combatants = battle_model_two.get_combatants()
+    assert combatants == [sample_meal1, sample_meal2]
+
+
+##################################################
+# Battle Score Test Cases
+##################################################
+
+@pytest.mark.parametrize("meal_fixture,modifier", [
+    ("sample_meal1", 2),
+    ("sample_meal2", 3),
+    ("sample_meal3", 1),
+])
+def test_get_battle_score(battle_model, request, meal_fixture, modifier):
+    """Test the battle score for each difficulty level."""
+    meal = request.getfixturevalue(meal_fixture)
+
+    expected = meal.price * len(meal.cuisine) - modifier
+    assert battle_model.get_battle_score(meal) == expected, f"Expected score {expected} for {meal.meal}"
+
+
+##################################################
+# Battle Test Cases
+##################################################
+
+@pytest.fixture
+def patched_battle(mocker):
+    """Mock the random.org call and the stats update used by a battle."""
+    return (mocker.patch("meal_max.models.battle_model.get_random"),
+            mocker.patch("meal_max.models.battle_model.update_meal_stats"))
+
+@pytest.mark.parametrize("rand,expected_winner,winner_id,loser_id", [
+    (0.1, "Pasta", 1, 2),  # delta (0.25) beats the random number, combatant 1 wins
+    (0.9, "Sushi", 2, 1),  # random number beats delta, combatant 2 wins
+])
+def test_battle(battle_model_two, patched_battle, rand, expected_winner, winner_id, loser_id):
+    """Test that a battle picks the winner from the score delta and the random number."""
+    mock_get_random, mock_update_stats = patched_battle
+    mock_get_random.return_value = rand
+
+    winner = battle_model_two.battle()
+    assert winner == expected_winner, f"Expected {expected_winner} to win, but got {winner}"
+
+    # Only the winner remains in the combatants list
+    assert len(battle_model_two.combatants) == 1, "Expected the loser to be removed from the combatants"
+    assert battle_model_two.combatants[0].meal == expected_winner
+
+    # Ensure both combatants' stats were updated, once each
+    mock_update_stats.assert_has_calls(
+        [call(winner_id, "win"), call(loser_id, "loss")],
+        any_order=True,
+    )
+    assert mock_update_stats.call_count == 2
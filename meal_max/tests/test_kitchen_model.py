@@ -0,0 +1,251 @@
+from contextlib import contextmanager
+from unittest.mock import Mock, mock_open
+
+import pytest
+
+from meal_max.models.kitchen_model import (
+    Meal,
+    clear_meals,
+    create_meal,
+    delete_meal,
+    get_leaderboard,
+    get_meal_by_id,
+    get_meal_by_name,
+    update_meal_stats
+)
+
+######################################################
+#
+#    Fixtures
+#
+######################################################
+
+def normalize_whitespace(sql_query: str) -> str:
+    return " ".join(sql_query.split())
+
+# Expected queries are constants, so normalize them once at import
+EXPECTED_INSERT_SQL = normalize_whitespace("""
+    INSERT INTO meals (meal, cuisine, price, difficulty)
+    VALUES (?, ?, ?, ?)
+""")
+EXPECTED_SELECT_DELETED_SQL = normalize_whitespace("SELECT deleted FROM meals WHERE id = ?")
+EXPECTED_UPDATE_DELETED_SQL = normalize_whitespace("UPDATE meals SET deleted = TRUE WHERE id = ?")
+
+_SQL_CREATE_TABLE_PATH = "sql/create_meal_table.sql"
+_FAKE_SQL = "CREATE TABLE meals ..."
+
+@pytest.fixture(scope="module", autouse=True)
+def _sql_create_table_path():
+    """Point clear_meals at the test schema path once for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("SQL_CREATE_TABLE_PATH", _SQL_CREATE_TABLE_PATH)
+        yield
+
+@pytest.fixture(scope="session")
+def _fake_sql_open():
+    """A single mock_open serving the fake create script, shared by clear_meals tests."""
+    return mock_open(read_data=_FAKE_SQL)
+
+# Row returned by the get_meal_by_* queries and the Meal it maps to
+_PASTA_ROW = (1, "Pasta", "Italian", 10.0, "MED", False)
+_PASTA_MEAL = Meal(id=1, meal="Pasta", cuisine="Italian", price=10.0, difficulty="MED")
+
+# The connection/cursor mocks are built once per module and reset per test
+@pytest.fixture(scope="module")
+def _mock_cursor_skeleton():
+    mock_conn = Mock()
+    mock_cursor = Mock()
+
+    # Mock the connection's cursor
+    mock_conn.cursor.return_value = mock_cursor
+    mock_conn.commit.return_value = None
+
+    return mock_conn, mock_cursor
+
+# Mocking the database connection for tests
+@pytest.fixture
+def mock_cursor(_mock_cursor_skeleton, mocker):
+    mock_conn, mock_cursor = _mock_cursor_skeleton
+
+    # Drop calls and expectations left over from the previous test
+    mock_conn.reset_mock()
+    mock_cursor.reset_mock(return_value=True, side_effect=True)
+    mock_cursor.execute.side_effect = None
+    mock_cursor.fetchone.return_value = None  # Default return for queries
+    mock_cursor.fetchall.return_value = []
+
+    # Mock the get_db_connection context manager from sql_utils
+    @contextmanager
+    def mock_get_db_connection():
+        yield mock_conn  # Yield the mocked connection object
+
+    mocker.patch("meal_max.models.kitchen_model.get_db_connection", mock_get_db_connection)
+
+    return mock_cursor  # Return the mock cursor so we can set expectations per test
+
+######################################################
+#
+#    Add and delete
+#
+######################################################
+
+@pytest.mark.parametrize("kwargs,exc,match", [
+    ({"meal": "Pasta", "cuisine": "Italian", "price": 10.0, "difficulty": "MED"}, None, None),
+    ({"meal": "Pizza", "cuisine": "Italian", "price": -10.0, "difficulty": "MED"}, ValueError, "Invalid price"),
+    ({"meal": "Pizza", "cuisine": "Italian", "price": 10.0, "difficulty": "MEDIUM"}, ValueError, "Invalid difficulty"),
+])
+def test_create_meal(request, kwargs, exc, match):
+    """Test creating a meal, and the errors raised for an invalid price or difficulty."""
+
+    if exc is not None:
+        # Invalid input is rejected before the database is touched
+        with pytest.raises(exc, match=match):
+            create_meal(**kwargs)
+        return
+
+    mock_cursor = request.getfixturevalue("mock_cursor")
+    create_meal(**kwargs)
+
+    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+
+    # Assert that the SQL query was correct
+    assert actual_query == EXPECTED_INSERT_SQL, "The SQL query did not match the expected structure."
+
+    # Assert that the SQL query was executed with the correct arguments
+    expected_arguments = ("Pasta", "Italian", 10.0, "MED")
+    actual_arguments = mock_cursor.execute.call_args[0][1]
+    assert actual_arguments == expected_arguments, f"The SQL query arguments did not match. Expected {expected_arguments}, got {actual_arguments}."
+
+@pytest.mark.parametrize("fetchone,meal_id,exc,match", [
+    ([False], 1, None, None),
+    (None, 999, ValueError, "Meal with ID 999 not found"),
+    ([True], 999, ValueError, "Meal with ID 999 has been deleted"),
+])
+def test_delete_meal(mock_cursor, fetchone, meal_id, exc, match):
+    """Test soft deleting a meal, and the errors for a missing or already deleted meal."""
+
+    # Simulate the deleted flag returned for the meal (None if it doesn't exist)
+    mock_cursor.fetchone.return_value = fetchone
+
+    if exc:
+        with pytest.raises(exc, match=match):
+            delete_meal(meal_id)
+    else:
+        delete_meal(meal_id)
+
+    # The deleted flag is always checked first
+    actual_select_sql = normalize_whitespace(mock_cursor.execute.call_args_list[0][0][0])
+    assert actual_select_sql == EXPECTED_SELECT_DELETED_SQL, "The SELECT query did not match the expected structure."
+    assert mock_cursor.execute.call_args_list[0][0][1] == (meal_id,)
+
+    if exc:
+        assert mock_cursor.execute.call_count == 1, "The meal should not be updated when deletion fails."
+        return
+
+    actual_update_sql = normalize_whitespace(mock_cursor.execute.call_args_list[1][0][0])
+    assert actual_update_sql == EXPECTED_UPDATE_DELETED_SQL, "The UPDATE query did not match the expected structure."
+    assert mock_cursor.execute.call_args_list[1][0][1] == (meal_id,)
+
+def test_clear_meals(mock_cursor, mocker, _fake_sql_open):
+    """Test clearing all meals by recreating the table."""
+
+    # Mock the file reading; the shared mock_open keeps calls between tests
+    _fake_sql_open.reset_mock()
+    mocker.patch("builtins.open", _fake_sql_open)
+
+    clear_meals()
+
+    # Ensure the file was opened using the environment variable's path
+    _fake_sql_open.assert_called_once_with(_SQL_CREATE_TABLE_PATH, "r")
+
+    # Verify that the create script was executed
+    mock_cursor.executescript.assert_called_once_with(_FAKE_SQL)
+
+
+######################################################
+#
+#    Get Meal
+#
+######################################################
+
+@pytest.mark.parametrize("getter,arg,where", [
+    (get_meal_by_id, 1, "id"),
+    (get_meal_by_name, "Pasta", "meal"),
+])
+def test_get_meal_success(mock_cursor, getter, arg, where):
+    """Test retrieving a meal by ID or by name."""
+
+    mock_cursor.fetchone.return_value = _PASTA_ROW
+
+    result = getter(arg)
+    assert result == _PASTA_MEAL, f"Expected {_PASTA_MEAL}, got {result}"
+
+    # Ensure the SQL query was executed correctly
+    expected_query = f"SELECT id, meal, cuisine, price, difficulty, deleted FROM meals WHERE {where} = ?"
+    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+    assert mock_cursor.execute.call_args[0][1] == (arg,)
+
+
+######################################################
+#
+#    Battle stats
+#
+######################################################
+
+@pytest.mark.parametrize("result,update_sql,exc,match", [
+    ("win", "UPDATE meals SET battles = battles + 1, wins = wins + 1 WHERE id = ?", None, None),
+    ("loss", "UPDATE meals SET battles = battles + 1 WHERE id = ?", None, None),
+    ("draw", None, ValueError, "Invalid result: draw"),
+])
+def test_update_meal_stats(mock_cursor, result, update_sql, exc, match):
+    """Test updating battle stats for a win or a loss, and rejecting any other result."""
+
+    # Simulate that the meal exists and is not deleted (id = 1)
+    mock_cursor.fetchone.return_value = (False,)
+
+    if exc:
+        with pytest.raises(exc, match=match):
+            update_meal_stats(1, result)
+        return
+
+    update_meal_stats(1, result)
+
+    # Ensure the stats were updated with the query for this result
+    mock_cursor.execute.assert_any_call(update_sql, (1,))
+
+
+######################################################
+#
+#    Leaderboard
+#
+######################################################
+
+@pytest.fixture(scope="module")
+def _lb_rows():
+    return [
+        (1, "Pasta", "Italian", 10.0, "MED", 10, 8, 0.8),
+        (2, "Sushi", "Japanese", 12.0, "LOW", 12, 9, 0.75),
+        (3, "Burger", "American", 8.0, "HIGH", 15, 5, 0.33)
+    ]
+
+@pytest.fixture(scope="module")
+def _lb_expected():
+    return [
+        {"id": 1, "meal": "Pasta", "cuisine": "Italian", "price": 10.0, "difficulty": "MED", "battles": 10, "wins": 8, "win_pct": 80.0},
+        {"id": 2, "meal": "Sushi", "cuisine": "Japanese", "price": 12.0, "difficulty": "LOW", "battles": 12, "wins": 9, "win_pct": 75.0},
+        {"id": 3, "meal": "Burger", "cuisine": "American", "price": 8.0, "difficulty": "HIGH", "battles": 15, "wins": 5, "win_pct": 33.0}
+    ]
+
+@pytest.mark.parametrize("sort_by", ["wins", "win_pct"])
+def test_get_leaderboard_sort(mock_cursor, _lb_rows, _lb_expected, sort_by):
+    """Test retrieving the leaderboard sorted by wins or by win percentage."""
+
+    mock_cursor.fetchall.return_value = _lb_rows
+
+    leaderboard = get_leaderboard(sort_by=sort_by)
+    assert leaderboard == _lb_expected, f"Expected {_lb_expected}, but got {leaderboard}"
+
+    # Ensure the query was ordered by the requested column
+    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    assert actual_query.endswith(f"ORDER BY {sort_by} DESC"), "The leaderboard query was not sorted as requested."
@@ -0,0 +1,232 @@
+from contextlib import nullcontext
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from meal_max.models import kitchen_model
+from meal_max.models.kitchen_model import (
+    Meal,
+    create_meal,
+    delete_meal,
+    get_leaderboard,
+    get_meal_by_id,
+    get_meal_by_name,
+    update_meal_stats
+)
+
+######################################################
+#
+#    Fixtures
+#
+######################################################
+
+CREATE_TABLE_SQL_PATH = os.path.join(os.path.dirname(__file__), "..", "sql", "create_meal_table.sql")
+
+class _SavepointConnection(sqlite3.Connection):
+    """Connection whose commit() is a no-op, so the per-test savepoint
+    stays open and everything a test wrote can be rolled back."""
+
+    def commit(self):
+        pass
+
+@pytest.fixture(scope="module")
+def db():
+    """One in-memory database shared by every test in the module.
+
+    kitchen_model.get_db_connection is patched to hand out this connection,
+    so the schema is created once instead of reconnecting for every call.
+    """
+    connection = sqlite3.connect(":memory:", isolation_level=None, factory=_SavepointConnection)
+    # Durability is irrelevant for a throwaway database, so skip the journal
+    # and fsync bookkeeping and give it a larger page cache
+    connection.executescript("""
+        PRAGMA journal_mode=MEMORY;
+        PRAGMA synchronous=OFF;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-16000;
+        PRAGMA locking_mode=EXCLUSIVE;
+    """)
+    with open(CREATE_TABLE_SQL_PATH, "r") as fh:
+        connection.executescript(fh.read())
+
+    with patch.object(kitchen_model, "get_db_connection", return_value=nullcontext(connection)):
+        yield connection
+
+    connection.close()
+
+def bulk_create_meals(connection, rows):
+    """Insert (meal, cuisine, price, difficulty) rows in a single executemany.
+
+    Bypasses create_meal's per-row validation and connection handling, so
+    use it only for setup data. The rows land in the test's savepoint, which
+    already makes this a single transaction.
+    """
+    connection.executemany("INSERT INTO meals (meal, cuisine, price, difficulty) VALUES (?, ?, ?, ?)", rows)
+
+def create_and_fetch(connection, meal, cuisine, price, difficulty):
+    """Insert a setup meal and return it as a Meal in one statement (SQLite >= 3.35)."""
+    row = connection.execute("""
+        INSERT INTO meals (meal, cuisine, price, difficulty)
+        VALUES (?, ?, ?, ?)
+        RETURNING id, meal, cuisine, price, difficulty
+    """, (meal, cuisine, price, difficulty)).fetchone()
+    return Meal(*row)
+
+def snapshot(connection):
+    """Return every meal as a (meal, cuisine, price, difficulty, battles, wins) tuple, in ID order."""
+    return connection.execute(
+        "SELECT meal, cuisine, price, difficulty, battles, wins FROM meals ORDER BY id"
+    ).fetchall()
+
+@pytest.fixture(autouse=True)
+def savepoint(db):
+    """Run every test inside a savepoint and roll it back afterwards."""
+    db.execute("SAVEPOINT t")
+    yield
+    db.execute("ROLLBACK TO t")
+    db.execute("RELEASE t")
+
+
+######################################################
+#
+#    Add and delete
+#
+######################################################
+
+def test_create_meal(db):
+    """Test that a created meal can be read back by name."""
+    create_meal("Pasta", "Italian", 10.0, "MED")
+
+    meal = get_meal_by_name("Pasta")
+    assert (meal.meal, meal.cuisine, meal.price, meal.difficulty) == ("Pasta", "Italian", 10.0, "MED")
+
+def test_create_meal_duplicate(db):
+    """Test error when creating a meal whose name already exists."""
+    create_meal("Pasta", "Italian", 10.0, "MED")
+
+    with pytest.raises(ValueError, match="Meal with name 'Pasta' already exists"):
+        create_meal("Pasta", "Italian", 12.0, "LOW")
+
+@pytest.mark.parametrize("price,difficulty,msg", [
+    (-10.0, "MED", "Invalid price: -10.0"),
+    (0, "MED", "Invalid price: 0"),
+    ("ten", "MED", "Invalid price: ten"),
+    (10.0, "MEDIUM", "Invalid difficulty level: MEDIUM"),
+])
+def test_create_meal_invalid(db, price, difficulty, msg):
+    """Test that invalid meals are rejected and nothing is written."""
+    with pytest.raises(ValueError, match=msg):
+        create_meal("Pasta", "Italian", price, difficulty)
+
+    assert db.execute("SELECT COUNT(*) FROM meals").fetchone()[0] == 0
+
+def test_delete_meal(db):
+    """Test that a deleted meal can no longer be retrieved."""
+    meal = create_and_fetch(db, "Pasta", "Italian", 10.0, "MED")
+
+    delete_meal(meal.id)
+
+    with pytest.raises(ValueError, match=f"Meal with ID {meal.id} has been deleted"):
+        get_meal_by_id(meal.id)
+
+
+######################################################
+#
+#    Get Meal
+#
+######################################################
+
+@pytest.mark.parametrize("getter,field", [
+    (get_meal_by_id, "id"),
+    (get_meal_by_name, "meal"),
+])
+def test_get_meal(db, getter, field):
+    """Test retrieving a meal by ID or by name."""
+    meal = create_and_fetch(db, "Pasta", "Italian", 10.0, "MED")
+
+    assert getter(getattr(meal, field)) == meal
+
+@pytest.mark.parametrize("getter,arg,msg", [
+    (get_meal_by_id, 999, "Meal with ID 999 not found"),
+    (get_meal_by_name, "Ramen", "Meal with name Ramen not found"),
+])
+def test_get_meal_not_found(db, getter, arg, msg):
+    """Test error when retrieving a meal that doesn't exist."""
+    with pytest.raises(ValueError, match=msg):
+        getter(arg)
+
+
+######################################################
+#
+#    Battle stats and leaderboard
+#
+######################################################
+
+@pytest.mark.parametrize("result,expected_stats,msg", [
+    ("win", (1, 1), None),
+    ("loss", (1, 0), None),
+    ("tie", (0, 0), "Invalid result: tie. Expected 'win' or 'loss'."),
+])
+def test_update_meal_stats(db, result, expected_stats, msg):
+    """Test recording a win or a loss, and rejecting any other result."""
+    meal = create_and_fetch(db, "Pasta", "Italian", 10.0, "MED")
+
+    if msg:
+        with pytest.raises(ValueError, match=msg):
+            update_meal_stats(meal.id, result)
+    else:
+        update_meal_stats(meal.id, result)
+
+    assert snapshot(db) == [("Pasta", "Italian", 10.0, "MED", *expected_stats)]
+
+def test_update_meal_stats_multiple_updates(db):
+    """Test that repeated wins and losses accumulate in the meal's stats."""
+    meal = create_and_fetch(db, "Mac&Cheese", "American", 6.0, "LOW")
+
+    for result in ("win", "loss", "win", "loss"):
+        update_meal_stats(meal.id, result)
+
+    assert snapshot(db) == [("Mac&Cheese", "American", 6.0, "LOW", 4, 2)]
+
+def test_get_leaderboard(db):
+    """Test that the leaderboard only lists meals that have battled, best first."""
+    bulk_create_meals(db, [
+        ("Pasta", "Italian", 10.0, "MED"),
+        ("Sushi", "Japanese", 12.0, "LOW"),
+        ("Burger", "American", 8.0, "HIGH")
+    ])
+    ids = dict(db.execute("SELECT meal, id FROM meals"))
+
+    update_meal_stats(ids["Pasta"], "win")
+    update_meal_stats(ids["Pasta"], "win")
+    update_meal_stats(ids["Sushi"], "loss")
+    update_meal_stats(ids["Sushi"], "win")
+
+    assert snapshot(db) == [
+        ("Pasta", "Italian", 10.0, "MED", 2, 2),
+        ("Sushi", "Japanese", 12.0, "LOW", 2, 1),
+        ("Burger", "American", 8.0, "HIGH", 0, 0)
+    ]
+
+    leaderboard = get_leaderboard("wins")
+    assert [(row["meal"], row["battles"], row["wins"]) for row in leaderboard] == [("Pasta", 2, 2), ("Sushi", 2, 1)]
+
+    leaderboard = get_leaderboard("win_pct")
+    assert [row["win_pct"] for row in leaderboard] == [100.0, 50.0]
+
+def test_get_leaderboard_uses_index(db):
+    """Test that the wins leaderboard is read from ix_meals_wins without a sort."""
+    statements = []
+    db.set_trace_callback(statements.append)
+    try:
+        get_leaderboard("wins")
+    finally:
+        db.set_trace_callback(None)
+
+    query = next(sql for sql in statements if "FROM meals" in sql)
+    plan = [row[3] for row in db.execute("EXPLAIN QUERY PLAN " + query)]
+
+    assert any("USING INDEX ix_meals_wins" in step for step in plan), f"Expected an index search, got {plan}"
+    assert not any("TEMP B-TREE" in step for step in plan), f"Expected no sort step, got {plan}"
@@ -0,0 +1,71 @@
+from unittest.mock import call
+
+import pytest
+import requests
+
+from meal_max.utils import random_utils
+from meal_max.utils.random_utils import get_random
+
+
+RANDOM_NUMBER = 0.42
+
+@pytest.fixture(autouse=True)
+def empty_buffer():
+    """Make every test start without buffered random numbers."""
+    random_utils._buffer.clear()
+    yield
+    random_utils._buffer.clear()
+
+@pytest.fixture
+def mock_random_org(mocker):
+    # Patch the get call on the shared session
+    # _SESSION.get returns an object, which we have replaced with a mock object
+    mock_response = mocker.Mock()
+    # We are giving that object a text attribute
+    mock_response.text = f"{RANDOM_NUMBER}"
+    mock_get = mocker.patch.object(random_utils._SESSION, "get", autospec=True)
+    mock_get.return_value = mock_response
+    return mock_response
+
+
+def test_get_random(mock_random_org):
+    """Test retrieving a random number from random.org."""
+    result = get_random()
+
+    # Assert that the result is the mocked random number
+    assert result == RANDOM_NUMBER, f"Expected random number {RANDOM_NUMBER}, but got {result}"
+
+    # Ensure that the correct URL was called
+    assert random_utils._SESSION.get.call_count == 1
+    assert random_utils._SESSION.get.call_args == call("https://www.random.org/decimal-fractions/?num=64&dec=2&col=1&format=plain&rnd=new", timeout=5)
+
+def test_get_random_uses_buffer(mock_random_org):
+    """Test that numbers left over from a batch are served without another request."""
+    mock_random_org.text = "0.42\n0.17\n"
+
+    assert get_random() == 0.42
+    assert get_random() == 0.17
+
+    # Both numbers came from a single request
+    assert random_utils._SESSION.get.call_count == 1
+
+def test_get_random_request_failure(mocker):
+    """Simulate  a request failure."""
+    mocker.patch.object(random_utils._SESSION, "get", side_effect=requests.exceptions.RequestException("Connection error"))
+
+    with pytest.raises(RuntimeError, match="Request to random.org failed: Connection error"):
+        get_random()
+
+def test_get_random_timeout(mocker):
+    """Simulate  a timeout."""
+    mocker.patch.object(random_utils._SESSION, "get", side_effect=requests.exceptions.Timeout)
+
+    with pytest.raises(RuntimeError, match="Request to random.org timed out."):
+        get_random()
+
+def test_get_random_invalid_response(mock_random_org):
+    """Simulate  an invalid response (non-digit)."""
+    mock_random_org.text = "invalid_response"
+
+    with pytest.raises(ValueError, match="Invalid response from random.org: invalid_response"):
+        get_random()